@@ -0,0 +1,133 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+# Shared by every child interpreter: point the default database at the
+# throwaway copy (if any) before Django opens it.
+PRELUDE = r"""
+import json, os, sys, time
+
+t0 = time.perf_counter()
+import django
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "quizquest.settings")
+from django.conf import settings
+if os.environ.get("BENCH_DB_NAME"):
+    settings.DATABASES["default"]["NAME"] = os.environ["BENCH_DB_NAME"]
+django.setup()
+"""
+
+MIGRATE = PRELUDE + r"""
+from django.core.management import call_command
+call_command("migrate", verbosity=0)
+"""
+
+# Runs in a fresh interpreter so every measurement is a true cold start.
+PROBE = PRELUDE + r"""
+from django.core.wsgi import get_wsgi_application
+application = get_wsgi_application()
+t_setup = time.perf_counter()
+
+t_warm = t_setup
+state = {"ready": None, "error": None}
+if sys.argv[1] == "warm":
+    from core import warmup
+    state = warmup.warm_up()
+    t_warm = time.perf_counter()
+
+from django.test import Client
+client = Client(HTTP_HOST="localhost")
+first = {}
+for path in sys.argv[2:]:
+    t = time.perf_counter()
+    client.get(path)
+    first[path] = (time.perf_counter() - t) * 1000
+
+print(json.dumps({
+    "setup_ms": (t_setup - t0) * 1000,
+    "warmup_ms": (t_warm - t_setup) * 1000,
+    "warmup_ready": state["ready"],
+    "warmup_error": state["error"],
+    "first_request_ms": first,
+}))
+"""
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure cold import / django.setup() time and first-request latency, "
+        "with and without warm-up. SQLite projects are benchmarked against a "
+        "freshly migrated temporary database; other engines use the configured one."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type=int, default=5)
+        parser.add_argument(
+            "--path",
+            action="append",
+            dest="paths",
+            help="URL to request after startup (repeatable). Defaults to / and /login/.",
+        )
+
+    def _run_child(self, code, *argv):
+        result = subprocess.run(
+            [sys.executable, "-c", code, *argv],
+            cwd=settings.BASE_DIR,
+            env=self.env,
+            capture_output=True,
+            text=True,
+        )
+        if result.returncode:
+            raise CommandError(result.stderr.strip())
+        return result.stdout
+
+    def _probe(self, mode, paths):
+        output = self._run_child(PROBE, mode, *paths)
+        return json.loads(output.strip().splitlines()[-1])
+
+    def handle(self, *args, **options):
+        if options["runs"] < 1:
+            raise CommandError("--runs must be at least 1.")
+
+        self.env = dict(os.environ, DJANGO_SETTINGS_MODULE=os.environ.get(
+            "DJANGO_SETTINGS_MODULE", "quizquest.settings"))
+
+        if settings.DATABASES["default"]["ENGINE"] == "django.db.backends.sqlite3":
+            with tempfile.TemporaryDirectory() as tmp:
+                self.env["BENCH_DB_NAME"] = os.path.join(tmp, "bench.sqlite3")
+                self._run_child(MIGRATE)
+                self._benchmark(options)
+        else:
+            self.stderr.write(self.style.WARNING(
+                "Benchmarking against the configured database."))
+            self._benchmark(options)
+
+    def _benchmark(self, options):
+        paths = options["paths"] or ["/", "/login/"]
+        runs = options["runs"]
+
+        for mode in ("cold", "warm"):
+            samples = [self._probe(mode, paths) for _ in range(runs)]
+            failed = [s for s in samples if mode == "warm" and not s["warmup_ready"]]
+            if failed:
+                raise CommandError(
+                    f"warm-up did not finish in {len(failed)}/{runs} runs: "
+                    f"{failed[0]['warmup_error']}"
+                )
+
+            self.stdout.write(f"{mode} start ({runs} runs, median):")
+            self.stdout.write(
+                f"  {'django.setup()':<24}{statistics.median(s['setup_ms'] for s in samples):8.2f} ms"
+            )
+            if mode == "warm":
+                self.stdout.write(
+                    f"  {'warm_up()':<24}{statistics.median(s['warmup_ms'] for s in samples):8.2f} ms"
+                )
+            for path in paths:
+                median = statistics.median(s["first_request_ms"][path] for s in samples)
+                self.stdout.write(f"  {'first GET ' + path:<24}{median:8.2f} ms")
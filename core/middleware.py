@@ -0,0 +1,26 @@
+from django.urls import reverse
+
+from . import views
+
+
+class HealthCheckMiddleware:
+    """
+    Serve /healthz/ before any other middleware runs.
+
+    Orchestrator probes usually send the pod IP or an internal hostname as
+    Host, which ALLOWED_HOSTS would reject with a 400. The health view never
+    reads the host, so it is answered here, ahead of host validation.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.health_path = None
+
+    def __call__(self, request):
+        if self.health_path is None:
+            self.health_path = reverse("health").rstrip("/")
+        # match with or without the trailing slash, so APPEND_SLASH's
+        # redirect (which validates the host) never sees the probe
+        if request.path_info.rstrip("/") == self.health_path:
+            return views.health_view(request)
+        return self.get_response(request)
@@ -1,3 +1,107 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.test import SimpleTestCase, TestCase
+from django.urls import reverse
+
+from core import warmup
+
+
+class HealthViewTests(TestCase):
+    def setUp(self):
+        warmup.reset()
+        self.addCleanup(warmup.reset)
+
+    def test_reports_ready_after_warm_up(self):
+        warmup.warm_up()
+
+        response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["status"], "ready")
+        self.assertTrue(all(data["steps"].values()))
+
+    def test_first_probe_starts_warm_up_if_it_never_ran(self):
+        # runserver / ASGI / other WSGI servers never call post_fork
+        response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["status"], "ready")
+        self.assertTrue(warmup.status()["steps"]["templates"])
+
+    def test_reports_warming_when_a_step_fails(self):
+        def fail():
+            raise RuntimeError("no such table: secret_internal_table")
+
+        with mock.patch.dict(warmup._STEP_FUNCS, {"database": fail}), \
+                self.assertLogs("core.warmup", level="ERROR"):
+            warmup.warm_up()
+            response = self.client.get(reverse("health"))
+
+        self.assertEqual(response.status_code, 503)
+        data = response.json()
+        self.assertEqual(data["status"], "warming")
+        self.assertFalse(data["steps"]["database"])
+        self.assertNotIn("secret_internal_table", response.content.decode())
+
+    def test_failed_steps_are_retried_after_backoff(self):
+        with mock.patch.dict(warmup._STEP_FUNCS, {"queries": mock.Mock(side_effect=RuntimeError)}), \
+                self.assertLogs("core.warmup", level="ERROR"):
+            warmup.warm_up()
+
+        warmup.warm_up_pending(backoff=60)
+        self.assertFalse(warmup.status()["ready"])
+
+        warmup.warm_up_pending(backoff=0)
+        self.assertTrue(warmup.status()["ready"])
+
+    def test_database_step_follows_live_connection(self):
+        warmup.warm_up()
+        self.assertTrue(warmup.status()["steps"]["database"])
+
+        # the in-memory test database can't really be closed, so simulate it
+        with mock.patch.object(connection, "connection", None):
+            state = warmup.status()
+        self.assertFalse(state["steps"]["database"])
+        self.assertFalse(state["ready"])
+
+    def test_reset_keeps_process_wide_steps(self):
+        warmup.warm_up()
+        warmup.reset(steps=("database", "queries"))
+
+        state = warmup.status()
+        self.assertFalse(state["ready"])
+        self.assertTrue(state["steps"]["templates"])
+        self.assertTrue(state["steps"]["urls"])
+        self.assertFalse(state["steps"]["database"])
+
+    def test_health_check_skips_host_validation(self):
+        warmup.warm_up()
+
+        response = self.client.get(reverse("health"), HTTP_HOST="10.0.0.5")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.client.get("/", HTTP_HOST="10.0.0.5").status_code, 400)
+
+    def test_health_check_without_trailing_slash(self):
+        warmup.warm_up()
+
+        response = self.client.get("/healthz", HTTP_HOST="10.0.0.5")
+
+        self.assertEqual(response.status_code, 200)
+
+
+class WarmupTemplateTests(SimpleTestCase):
+    def test_compiles_view_and_admin_templates(self):
+        names = warmup.template_names()
+
+        for name in ("home.html", "take_quiz.html", "admin/login.html", "admin/base_site.html"):
+            self.assertIn(name, names)
+
+
+class BenchStartupCommandTests(SimpleTestCase):
+    def test_rejects_non_positive_runs(self):
+        with self.assertRaisesMessage(CommandError, "--runs must be at least 1."):
+            call_command("bench_startup", runs=0)
@@ -5,6 +5,7 @@ urlpatterns = [
     # public / auth
     path("", views.home, name="home"),
     path("dashboard/", views.dashboard, name="dashboard"),
+    path("healthz/", views.health_view, name="health"),
 
     path("login/", views.login_view, name="login"),
     path("logout/", views.logout_view, name="logout"),
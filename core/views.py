@@ -6,8 +6,11 @@ from django.contrib.auth.decorators import login_required, user_passes_test
 from django.contrib.auth.models import User
 from django.db import transaction
 from django.db.models import Avg
+from django.http import JsonResponse
 from django.shortcuts import get_object_or_404, redirect, render
+from django.views.decorators.cache import never_cache
 
+from . import warmup
 from .models import Profile, Quiz, Question, Choice, QuizSubmission, Answer
 
 
@@ -16,6 +19,28 @@ def home(request):
     return render(request, "home.html", context)
 
 
+@never_cache
+def health_view(request):
+    """
+    Readiness probe for load balancers / autoscalers.
+    Returns 200 once templates, URLs, DB connection and ORM queries are warm
+    (done by gunicorn's post_fork, or by the first probe elsewhere), otherwise
+    503. Unfinished steps are retried with a backoff, and the DB connection is
+    re-checked on each call.
+    """
+    warmup.warm_up_pending()
+    warmup.check_database()
+    state = warmup.status()
+
+    return JsonResponse(
+        {
+            "status": "ready" if state["ready"] else "warming",
+            "steps": state["steps"],
+        },
+        status=200 if state["ready"] else 503,
+    )
+
+
 # ---------- AUTH VIEWS ----------
 
 def register_view(request):
@@ -0,0 +1,196 @@
+"""
+Process warm-up for QuizQuest workers.
+
+Everything a fresh worker would otherwise do lazily on its first requests
+(compiling templates, building the URL resolver, opening the database
+connection, compiling the ORM queries the quiz views run) is done up front
+by warm_up(). The health endpoint reports "ready" only once every step has
+succeeded and the database connection is still alive.
+"""
+import logging
+import threading
+import time
+from pathlib import Path
+
+from django.apps import apps
+from django.db import connections
+from django.template import engines
+from django.urls import get_resolver
+
+from .models import Quiz, Question
+
+logger = logging.getLogger(__name__)
+
+STEPS = ("templates", "urls", "database", "queries")
+
+# Minimum number of seconds between two retries of unfinished steps.
+RETRY_BACKOFF = 5.0
+
+_lock = threading.Lock()
+_state = {
+    "steps": {},
+    "duration_ms": None,
+    "error": None,
+    "last_attempt": None,
+}
+
+
+def template_names():
+    """
+    Every template shipped by the project: the core app's templates (including
+    its admin overrides) and anything in the engines' DIRS.
+    """
+    roots = [Path(apps.get_app_config("core").path) / "templates"]
+    for engine in engines.all():
+        roots.extend(Path(d) for d in engine.engine.dirs)
+
+    names = set()
+    for root in roots:
+        if root.is_dir():
+            names.update(
+                path.relative_to(root).as_posix()
+                for path in root.rglob("*.html")
+            )
+    return sorted(names)
+
+
+def _compile_templates():
+    # Compiled once so the cached template loader serves them without
+    # touching the filesystem on the first hit.
+    for engine in engines.all():
+        for name in template_names():
+            engine.get_template(name)
+
+
+def _populate_url_resolver():
+    resolver = get_resolver()
+    # Accessing reverse_dict forces the resolver to walk every include(),
+    # including admin.site.urls, and cache the result.
+    resolver.reverse_dict
+    resolver.resolve("/")
+
+
+def _open_database_connections():
+    for conn in connections.all():
+        conn.ensure_connection()
+
+
+def _warm_queries():
+    # Run the query shapes of quiz_list_view / take_quiz_view once (limited to
+    # a single row) so model metadata, prefetch descriptors and SQL compilation
+    # are primed. Nothing is kept; the views still query the database.
+    list(Quiz.objects.filter(is_active=True).order_by("-created_at")[:1])
+    list(Question.objects.prefetch_related("choices")[:1])
+
+
+_STEP_FUNCS = {
+    "templates": _compile_templates,
+    "urls": _populate_url_resolver,
+    "database": _open_database_connections,
+    "queries": _warm_queries,
+}
+
+
+def _run(steps):
+    started = time.perf_counter()
+    _state["error"] = None
+    for step in steps:
+        if _state["steps"].get(step) and step != "database":
+            continue
+        try:
+            _STEP_FUNCS[step]()
+        except Exception as exc:
+            logger.exception("Warm-up step %r failed", step)
+            _state["steps"][step] = False
+            _state["error"] = f"{step}: {exc}"
+            break
+        _state["steps"][step] = True
+
+    _state["last_attempt"] = time.monotonic()
+    _state["duration_ms"] = round((time.perf_counter() - started) * 1000, 2)
+
+
+def warm_up(steps=STEPS):
+    """
+    Run the requested warm-up steps and return a copy of the status.
+
+    Steps that already succeeded are skipped (the database step always
+    re-checks its connection), so this is cheap to call again. The first
+    failing step stops the run; it is logged and recorded in status["error"].
+    """
+    with _lock:
+        _run(steps)
+    return status()
+
+
+def warm_up_pending(backoff=RETRY_BACKOFF):
+    """
+    Run the steps that have not succeeded yet.
+
+    Starts the warm-up if it never ran in this process (runserver, ASGI, a
+    WSGI server without gunicorn.conf.py). Retries are skipped if the last
+    attempt was less than `backoff` seconds ago or if another thread is
+    already warming up.
+    """
+    last_attempt = _state["last_attempt"]
+    if last_attempt is not None and time.monotonic() - last_attempt < backoff:
+        return
+    if not _lock.acquire(blocking=False):
+        return
+    try:
+        pending = [step for step in STEPS if not _state["steps"].get(step)]
+        if pending:
+            _run(pending)
+    finally:
+        _lock.release()
+
+
+def database_alive():
+    """True if every configured database has an open, usable connection."""
+    for conn in connections.all():
+        if conn.connection is None or not conn.is_usable():
+            return False
+    return True
+
+
+def check_database():
+    """
+    Make sure this thread's database connections are open, reconnecting if
+    CONN_MAX_AGE expired them. Returns False (and logs) if that fails.
+    """
+    try:
+        _open_database_connections()
+    except Exception:
+        logger.exception("Database health check failed")
+        return False
+    return True
+
+
+def status():
+    """
+    Snapshot of the current warm-up state.
+
+    The "database" step reflects the live connection, not the last warm-up.
+    "error" may contain internal details and must not be sent to clients.
+    """
+    steps = {step: bool(_state["steps"].get(step)) for step in STEPS}
+    steps["database"] = steps["database"] and database_alive()
+    return {
+        "ready": all(steps.values()),
+        "steps": steps,
+        "duration_ms": _state["duration_ms"],
+        "error": _state["error"],
+    }
+
+
+def reset(steps=STEPS):
+    """
+    Forget warm-up progress for the given steps.
+
+    After a fork the compiled templates and URL resolver are still valid, but
+    the database connection belongs to the parent.
+    """
+    with _lock:
+        for step in steps:
+            _state["steps"].pop(step, None)
+        _state.update(error=None, last_attempt=None)
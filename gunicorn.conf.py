@@ -0,0 +1,30 @@
+"""
+Gunicorn config for QuizQuest.
+
+    gunicorn quizquest.wsgi -c gunicorn.conf.py
+
+The app is loaded once in the master (preload_app) and the process-independent
+warm-up (templates, URL resolver) is done there, so forked workers inherit it.
+Each worker then opens its own DB connection and primes the ORM queries in
+post_fork, before it accepts traffic. /healthz/ reports ready after that.
+"""
+preload_app = True
+
+
+def when_ready(server):
+    from core import warmup
+
+    state = warmup.warm_up(steps=("templates", "urls"))
+    server.log.info("QuizQuest master warm-up: %s", state)
+
+
+def post_fork(server, worker):
+    from django.db import connections
+
+    from core import warmup
+
+    # Never share the master's DB sockets with the workers.
+    connections.close_all()
+    warmup.reset(steps=("database", "queries"))
+    state = warmup.warm_up()
+    worker.log.info("QuizQuest worker %s warm-up: %s", worker.pid, state)